@@ -32,11 +32,14 @@ def main() -> None:
     settings = Settings()
     logger.info("Starting gym-bot")
 
-    db = Database(settings.mongo_uri, settings.mongo_database)
+    db = Database.from_settings(settings)
 
     training_repo = TrainingRepository(db)
     config_service = UserConfigService(
-        db, settings.default_config_path, settings.owner_user_id
+        db,
+        settings.default_config_path,
+        settings.owner_user_id,
+        settings.config_cache_ttl,
     )
     reporting_service = ReportingService(training_repo, settings)
     exercise_reporting = ExerciseReportingService(training_repo, config_service)
@@ -49,7 +52,7 @@ def main() -> None:
         settings=settings,
     )
 
-    app = build_application(services, settings.telegram_token)
+    app = build_application(services, settings.telegram_token, settings.telegram_http_version)
 
     async def post_init(_app):
         await db.ping()
@@ -20,8 +20,8 @@ async def error_handler(update: object, context) -> None:
         )
 
 
-def build_application(services: Services, token: str) -> Application:
-    app = Application.builder().token(token).build()
+def build_application(services: Services, token: str, http_version: str = "1.1") -> Application:
+    app = Application.builder().token(token).http_version(http_version).build()
     app.bot_data["services"] = services
 
     app.add_handler(build_add_training_handler())
@@ -17,8 +17,8 @@ from gym_bot.bot.callbacks import ADD_WORKOUT, COMPLETED, FINISH_TRAINING, parse
 from gym_bot.bot.keyboards import completion_keyboard, workout_selection_keyboard
 from gym_bot.bot.state import clear_add_state, get_add_state
 from gym_bot.config.models import ExerciseConfig
-from gym_bot.domain.metrics import METRIC_REGISTRY, format_metric_prompt
 from gym_bot.domain.models import Exercise, ExerciseSet, Training, Workout
+from gym_bot.domain.names import display_name
 
 logger = logging.getLogger(__name__)
 
@@ -50,7 +50,7 @@ async def _prompt_current_exercise(update: Update, context: CallbackContext):
     name, config = state.current_exercises[state.current_exercise_idx]
 
     state.current_exercise = Exercise(name=name)
-    title = name.replace("_", " ").title()
+    title = display_name(name)
 
     if config.track_rest:
         await update.effective_message.reply_text(
@@ -58,16 +58,16 @@ async def _prompt_current_exercise(update: Update, context: CallbackContext):
             parse_mode="MarkdownV2",
         )
     else:
-        await _prompt_sets(update, title, config.metrics)
+        await _prompt_sets(update, title, config.metric_prompt)
 
     return PROCESSING_EXERCISES
 
 
-async def _prompt_sets(update: Update, title: str, metrics: list[str]) -> None:
+async def _prompt_sets(update: Update, title: str, metric_prompt: str) -> None:
     await update.effective_message.reply_text(
         messages.PROMPT_SETS.format(
             exercise_title=title,
-            metric_names=format_metric_prompt(metrics),
+            metric_names=metric_prompt,
         ),
         parse_mode="MarkdownV2",
     )
@@ -180,6 +180,7 @@ async def finish_training(update: Update, context: CallbackContext):
     await query.edit_message_text("Saving your training session...")
 
     await services.trainings.save(state.training)
+    services.reporting.invalidate_calendar(state.training.user_id, state.training.date)
     await query.edit_message_text(messages.SAVE_SUCCESS)
 
     clear_add_state(context)
@@ -194,7 +195,7 @@ async def received_completion(update: Update, context: CallbackContext):
     state = get_add_state(context)
     state.current_workout.completed = value == "yes"
 
-    workout_title = state.current_workout.name.replace("_", " ").title()
+    workout_title = display_name(state.current_workout.name)
     await query.edit_message_text(messages.LOGGING_EXERCISES.format(workout_name=workout_title))
 
     return await _prompt_current_exercise(update, context)
@@ -222,8 +223,8 @@ async def _handle_rest(
 
     state = get_add_state(context)
     state.current_exercise.rest = rest
-    title = name.replace("_", " ").title()
-    await _prompt_sets(update, title, config.metrics)
+    title = display_name(name)
+    await _prompt_sets(update, title, config.metric_prompt)
     return PROCESSING_EXERCISES
 
 
@@ -239,10 +240,10 @@ async def _handle_set(update: Update, context: CallbackContext, config: Exercise
         return PROCESSING_EXERCISES
 
     try:
-        parsed = {}
-        for name, raw in zip(metrics, values):
-            defn = METRIC_REGISTRY[name]
-            parsed[name] = defn.value_type(raw)
+        parsed = {
+            name: value_type(raw)
+            for name, value_type, raw in zip(metrics, config.value_types, values)
+        }
 
         new_set = ExerciseSet(metrics=parsed)
         state.current_exercise.sets.append(new_set)
@@ -251,7 +252,7 @@ async def _handle_set(update: Update, context: CallbackContext, config: Exercise
         count = len(state.current_exercise.sets)
         await update.message.reply_text(messages.SET_ADDED.format(count=count + 1))
 
-    except (ValueError, KeyError):
+    except ValueError:
         await update.message.reply_text(messages.ERROR_PROCESSING_SET)
 
     return PROCESSING_EXERCISES
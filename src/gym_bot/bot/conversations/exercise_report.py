@@ -18,6 +18,7 @@ from gym_bot.bot.callbacks import (
 from gym_bot.bot.keyboards import chunk_buttons
 from gym_bot.bot.services import get_services
 from gym_bot.bot.state import clear_report_state, get_report_state
+from gym_bot.domain.names import display_name
 
 logger = logging.getLogger(__name__)
 
@@ -53,7 +54,7 @@ async def report_start(update: Update, context: CallbackContext):
 
     buttons = [
         InlineKeyboardButton(
-            n.replace("_", " ").title(),
+            display_name(n),
             callback_data=make_callback(SELECT_EXERCISE, n),
         )
         for n in names
@@ -89,7 +90,7 @@ async def exercise_selected(update: Update, context: CallbackContext):
         for key, display in reports
     ]
 
-    title = exercise_name.replace("_", " ").title()
+    title = display_name(exercise_name)
     await query.edit_message_text(
         f"Report for *{title}*?",
         reply_markup=InlineKeyboardMarkup(keyboard),
@@ -118,7 +119,7 @@ async def report_type_selected(update: Update, context: CallbackContext):
     )
 
     if not report:
-        title = state.exercise_name.replace("_", " ").title()
+        title = display_name(state.exercise_name)
         await query.edit_message_text(
             f"No data found for *{title}* in the last {state.days} days.",
             parse_mode="Markdown",
@@ -36,7 +36,7 @@ async def view_start(update: Update, context: CallbackContext):
     t1 = datetime.now()
     t0 = t1 - timedelta(days=days)
 
-    trainings = await services.trainings.find_between_dates(user_id, t0, t1)
+    trainings = await services.trainings.find_summaries_between_dates(user_id, t0, t1)
     if not trainings:
         await update.message.reply_text(f"No sessions found in the last {days} days.")
         return ConversationHandler.END
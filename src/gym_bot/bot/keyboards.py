@@ -1,3 +1,5 @@
+from functools import lru_cache
+
 from telegram import InlineKeyboardButton, InlineKeyboardMarkup
 
 from gym_bot.bot.callbacks import ADD_WORKOUT, COMPLETED, FINISH_TRAINING, make_callback
@@ -10,6 +12,11 @@ def chunk_buttons(items: list, size: int) -> list[list]:
 
 
 def workout_selection_keyboard(workout_names: list[str]) -> InlineKeyboardMarkup:
+    return _workout_selection_keyboard(tuple(workout_names))
+
+
+@lru_cache(maxsize=128)
+def _workout_selection_keyboard(workout_names: tuple[str, ...]) -> InlineKeyboardMarkup:
     buttons = [
         InlineKeyboardButton(
             name.replace("_", " ").lower(),
@@ -22,6 +29,7 @@ def workout_selection_keyboard(workout_names: list[str]) -> InlineKeyboardMarkup
     return InlineKeyboardMarkup(rows)
 
 
+@lru_cache(maxsize=1)
 def completion_keyboard() -> InlineKeyboardMarkup:
     return InlineKeyboardMarkup([
         [
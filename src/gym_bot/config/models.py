@@ -1,6 +1,8 @@
+from functools import cached_property
+
 from pydantic import BaseModel, ConfigDict, field_validator, model_validator
 
-from gym_bot.domain.metrics import METRIC_REGISTRY
+from gym_bot.domain.metrics import METRIC_REGISTRY, format_metric_prompt
 
 
 class ExerciseConfig(BaseModel):
@@ -16,6 +18,14 @@ class ExerciseConfig(BaseModel):
                 raise ValueError(f"Unknown metric: {m!r}")
         return v
 
+    @cached_property
+    def value_types(self) -> tuple[type, ...]:
+        return tuple(METRIC_REGISTRY[m].value_type for m in self.metrics)
+
+    @cached_property
+    def metric_prompt(self) -> str:
+        return format_metric_prompt(self.metrics)
+
 
 class UserConfig(BaseModel):
     model_config = ConfigDict(extra="ignore")
@@ -47,5 +57,13 @@ class UserConfig(BaseModel):
     def get_all_exercise_names(self) -> list[str]:
         return list(self.exercises.keys())
 
+    @cached_property
+    def workouts_by_exercise(self) -> dict[str, list[str]]:
+        index: dict[str, list[str]] = {}
+        for workout_name, names in self.workouts.items():
+            for name in dict.fromkeys(names):
+                index.setdefault(name, []).append(workout_name)
+        return index
+
     def get_workouts_for_exercise(self, exercise_name: str) -> list[str]:
-        return [w for w, names in self.workouts.items() if exercise_name in names]
+        return list(self.workouts_by_exercise.get(exercise_name, []))
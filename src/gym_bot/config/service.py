@@ -1,19 +1,37 @@
 import logging
+import os
+import time
+from collections.abc import Callable
 
 import yaml
+from cachetools import TTLCache
 
 from gym_bot.config.models import UserConfig
 from gym_bot.db.mongo import Database
 
 logger = logging.getLogger(__name__)
 
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+_CONFIG_PROJECTION = {"_id": 0, "user_id": 1, "exercises": 1, "workouts": 1}
+
 
 class UserConfigService:
-    def __init__(self, db: Database, yaml_path: str, owner_user_id: int | None):
+    def __init__(
+        self,
+        db: Database,
+        yaml_path: str,
+        owner_user_id: int | None,
+        cache_ttl: int = 300,
+        timer: Callable[[], float] = time.monotonic,
+    ):
         self._col = db.user_configs
         self._yaml_path = yaml_path
         self._owner_user_id = owner_user_id
-        self._cache: dict[int, UserConfig] = {}
+        self._cache: TTLCache[int, UserConfig] = TTLCache(
+            maxsize=10_000, ttl=cache_ttl, timer=timer
+        )
+        self._yaml_cache: tuple[int, dict] | None = None
 
     async def sync_owner(self) -> None:
         if self._owner_user_id is None:
@@ -24,10 +42,11 @@ class UserConfigService:
         logger.info("Synced owner config for user %s from YAML", self._owner_user_id)
 
     async def get_config(self, user_id: int) -> UserConfig:
-        if user_id in self._cache:
-            return self._cache[user_id]
+        config = self._cache.get(user_id)
+        if config is not None:
+            return config
 
-        doc = await self._col.find_one({"user_id": user_id})
+        doc = await self._col.find_one({"user_id": user_id}, _CONFIG_PROJECTION)
         if doc is None:
             config = UserConfig(user_id=user_id, **self._load_yaml())
             await self._upsert(config)
@@ -39,23 +58,20 @@ class UserConfigService:
         return config
 
     def _load_yaml(self) -> dict:
+        mtime = os.stat(self._yaml_path).st_mtime_ns
+        if self._yaml_cache is not None and self._yaml_cache[0] == mtime:
+            return self._yaml_cache[1]
+
         with open(self._yaml_path, "r") as f:
-            data = yaml.safe_load(f) or {}
-        return {
+            data = yaml.load(f, Loader=_YAML_LOADER) or {}
+        parsed = {
             "exercises": data.get("exercises", {}),
             "workouts": data.get("workouts", {}),
         }
+        self._yaml_cache = (mtime, parsed)
+        return parsed
 
     async def _upsert(self, config: UserConfig) -> None:
-        dumped = config.model_dump()
-        await self._col.update_one(
-            {"user_id": config.user_id},
-            {
-                "$set": {
-                    "user_id": config.user_id,
-                    "exercises": dumped["exercises"],
-                    "workouts": dumped["workouts"],
-                }
-            },
-            upsert=True,
+        await self._col.replace_one(
+            {"user_id": config.user_id}, config.model_dump(), upsert=True
         )
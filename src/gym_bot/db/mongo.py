@@ -1,15 +1,41 @@
 import logging
 
 from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorCollection, AsyncIOMotorDatabase
+from pymongo.errors import OperationFailure
+
+from gym_bot.settings import Settings
 
 logger = logging.getLogger(__name__)
 
+_INDEX_NOT_FOUND = 27
+
 
 class Database:
-    def __init__(self, uri: str, db_name: str):
-        self.client = AsyncIOMotorClient(uri, serverSelectionTimeoutMS=5000)
+    def __init__(
+        self,
+        uri: str,
+        db_name: str,
+        max_pool_size: int = 50,
+        min_pool_size: int = 5,
+    ):
+        self.client = AsyncIOMotorClient(
+            uri,
+            serverSelectionTimeoutMS=5000,
+            maxPoolSize=max_pool_size,
+            minPoolSize=min_pool_size,
+            waitQueueTimeoutMS=5000,
+        )
         self.db: AsyncIOMotorDatabase = self.client[db_name]
 
+    @classmethod
+    def from_settings(cls, settings: Settings) -> "Database":
+        return cls(
+            settings.mongo_uri,
+            settings.mongo_database,
+            max_pool_size=settings.mongo_max_pool_size,
+            min_pool_size=settings.mongo_min_pool_size,
+        )
+
     @property
     def trainings(self) -> AsyncIOMotorCollection:
         return self.db["trainings"]
@@ -23,7 +49,20 @@ class Database:
         logger.info("Connected to MongoDB")
 
     async def ensure_indexes(self):
-        await self.trainings.create_index([("user_id", 1), ("date", 1)])
+        await self.trainings.create_index(
+            [("user_id", 1), ("date", 1), ("workouts.name", 1)],
+            name="user_date_workout",
+        )
+        await self.trainings.create_index(
+            [("user_id", 1), ("workouts.name", 1), ("date", -1)],
+            name="user_workout_date",
+        )
+        # Superseded by user_date_workout, which starts with the same keys.
+        try:
+            await self.trainings.drop_index("user_id_1_date_1")
+        except OperationFailure as e:
+            if e.code != _INDEX_NOT_FOUND:
+                raise
         await self.user_configs.create_index("user_id", unique=True)
         logger.info("Database indexes ensured")
 
@@ -1,15 +1,35 @@
 import logging
+from collections.abc import AsyncIterator, Collection
 from datetime import datetime, timezone
 from typing import Any, Optional
 
 from bson import ObjectId
+from pymongo import ReplaceOne, WriteConcern
 
 from gym_bot.db.mongo import Database
 from gym_bot.domain.errors import TrainingNotFoundError
-from gym_bot.domain.models import Training
+from gym_bot.domain.models import TRAINING_LIST_ADAPTER, Training
 
 logger = logging.getLogger(__name__)
 
+# Fields declared on Training; anything else is dropped by the model anyway.
+_TRAINING_PROJECTION = {"_id": 1, "user_id": 1, "date": 1, "duration": 1, "workouts": 1}
+
+# Enough to render calendars and session lists without the set data.
+_SUMMARY_PROJECTION = {
+    "user_id": 1,
+    "date": 1,
+    "duration": 1,
+    "workouts.name": 1,
+    "workouts.completed": 1,
+}
+
+_READ_BATCH_SIZE = 500
+
+
+def _without_nulls(array: str) -> dict[str, Any]:
+    return {"$filter": {"input": array, "cond": {"$ne": ["$$this", None]}}}
+
 
 def _ensure_utc(dt: datetime) -> datetime:
     if dt.tzinfo is None:
@@ -22,51 +42,158 @@ class TrainingRepository:
         self._col = db.trainings
 
     async def save(self, training: Training) -> str:
-        doc = training.model_dump(by_alias=True, exclude_none=True)
-        result = await self._col.insert_one(doc)
+        result = await self._col.insert_one(training.to_mongo())
         logger.info("Saved training for user %s", training.user_id)
         return str(result.inserted_id)
 
+    async def upsert_many(self, trainings: list[Training], acknowledged: bool = True) -> int:
+        if not trainings:
+            return 0
+        ops = [ReplaceOne({"_id": t.id}, t.to_mongo(), upsert=True) for t in trainings]
+        if not acknowledged:
+            col = self._col.with_options(write_concern=WriteConcern(w=0))
+            await col.bulk_write(ops, ordered=False)
+            return len(ops)
+        result = await self._col.bulk_write(ops, ordered=False)
+        return result.matched_count + result.upserted_count
+
     async def find_by_id(self, training_id: str) -> Training:
         doc = await self._col.find_one({"_id": ObjectId(training_id)})
         if doc is None:
             raise TrainingNotFoundError(f"Training {training_id} not found")
         return Training(**doc)
 
-    async def find_between_dates(
+    async def find_between_dates(self, user_id: int, t0: datetime, t1: datetime) -> list[Training]:
+        query = self._date_query(user_id, t0, t1)
+        return await self._execute(query)
+
+    async def find_summaries_between_dates(
+        self, user_id: int, t0: datetime, t1: datetime
+    ) -> list[Training]:
+        """Partial trainings: workouts carry only name and completed, exercises are empty.
+
+        For listing sessions; load the full training with find_by_id before
+        formatting its details or saving it back.
+        """
+        query = self._date_query(user_id, t0, t1)
+        return await self._execute(query, _SUMMARY_PROJECTION)
+
+    async def iter_summaries_with_workout_filter(
         self,
         user_id: int,
         t0: datetime,
         t1: datetime,
-    ) -> list[Training]:
-        query = self._date_query(user_id, t0, t1)
-        return await self._execute(query)
+        include: Optional[Collection[str]] = None,
+        exclude: Optional[Collection[str]] = None,
+    ) -> AsyncIterator[Training]:
+        """Stream partial trainings, as find_summaries_between_dates, filtered by workout."""
+        query = self._workout_filter_query(user_id, t0, t1, include, exclude)
+        cursor = self._col.find(query, _SUMMARY_PROJECTION, batch_size=_READ_BATCH_SIZE)
+        async for doc in cursor.sort("date", -1):
+            yield Training(**doc)
 
-    async def find_with_workout_filter(
+    async def find_training_days(
         self,
         user_id: int,
         t0: datetime,
         t1: datetime,
-        include: Optional[list[str]] = None,
-        exclude: Optional[list[str]] = None,
-    ) -> list[Training]:
-        query = self._date_query(user_id, t0, t1)
-        if include:
-            query["workouts.name"] = {"$in": include}
-        elif exclude:
-            query["workouts.name"] = {"$nin": exclude}
-        return await self._execute(query)
+        include: Optional[Collection[str]] = None,
+        exclude: Optional[Collection[str]] = None,
+    ) -> dict[int, bool]:
+        query = self._workout_filter_query(user_id, t0, t1, include, exclude)
+        pipeline = [
+            {"$match": query},
+            {"$unwind": {"path": "$workouts", "preserveNullAndEmptyArrays": True}},
+            # $min ignores missing values, so a day whose trainings have no
+            # workouts comes out as null and counts as completed.
+            {
+                "$group": {
+                    "_id": {"$dayOfMonth": "$date"},
+                    "completed": {"$min": "$workouts.completed"},
+                }
+            },
+            {"$project": {"completed": {"$ifNull": ["$completed", True]}}},
+        ]
+        return {doc["_id"]: doc["completed"] async for doc in self._col.aggregate(pipeline)}
 
-    async def find_all(self) -> list[Training]:
-        cursor = self._col.find().sort("date", -1)
-        return [Training(**doc) async for doc in cursor]
+    async def find_exercise_sessions(
+        self,
+        user_id: int,
+        exercise_name: str,
+        workouts: Collection[str],
+        t0: datetime,
+        t1: datetime,
+    ) -> list[dict[str, Any]]:
+        workouts = list(workouts)
+        match = self._date_query(user_id, t0, t1)
+        match["workouts.name"] = {"$in": workouts}
+        pipeline = [
+            {"$match": match},
+            {"$unwind": "$workouts"},
+            {"$match": {"workouts.name": {"$in": workouts}}},
+            {"$unwind": "$workouts.exercises"},
+            {"$match": {"workouts.exercises.name": exercise_name}},
+            # Keep exercises without sets so their rest still counts.
+            {
+                "$unwind": {
+                    "path": "$workouts.exercises.sets",
+                    "preserveNullAndEmptyArrays": True,
+                }
+            },
+            {
+                "$group": {
+                    "_id": "$_id",
+                    "date": {"$first": "$date"},
+                    "sets": {"$push": {"$ifNull": ["$workouts.exercises.sets.metrics", None]}},
+                    "rests": {"$push": {"$ifNull": ["$workouts.exercises.rest", None]}},
+                }
+            },
+            {
+                "$project": {
+                    "_id": 0,
+                    "date": 1,
+                    "sets": _without_nulls("$sets"),
+                    "rest": {
+                        "$ifNull": [{"$arrayElemAt": [_without_nulls("$rests"), -1]}, None]
+                    },
+                }
+            },
+            {"$match": {"sets.0": {"$exists": True}}},
+            {"$sort": {"date": 1}},
+        ]
+        return await self._col.aggregate(pipeline).to_list(length=None)
+
+    async def iter_all(self, batch_size: int = _READ_BATCH_SIZE) -> AsyncIterator[Training]:
+        cursor = self._col.find(
+            projection=_TRAINING_PROJECTION, batch_size=batch_size
+        ).sort("date", -1)
+        async for doc in cursor:
+            yield Training(**doc)
 
     def _date_query(self, user_id: int, t0: datetime, t1: datetime) -> dict[str, Any]:
         return {
             "user_id": user_id,
-            "date": {"$gte": _ensure_utc(t0), "$lte": _ensure_utc(t1)},
+            "date": {"$gte": _ensure_utc(t0), "$lt": _ensure_utc(t1)},
         }
 
-    async def _execute(self, query: dict) -> list[Training]:
-        cursor = self._col.find(query).sort("date", -1)
-        return [Training(**doc) async for doc in cursor]
+    def _workout_filter_query(
+        self,
+        user_id: int,
+        t0: datetime,
+        t1: datetime,
+        include: Optional[Collection[str]],
+        exclude: Optional[Collection[str]],
+    ) -> dict[str, Any]:
+        query = self._date_query(user_id, t0, t1)
+        if include:
+            query["workouts.name"] = {"$in": list(include)}
+        elif exclude:
+            query["workouts.name"] = {"$nin": list(exclude)}
+        return query
+
+    async def _execute(
+        self, query: dict, projection: Optional[dict[str, Any]] = None
+    ) -> list[Training]:
+        cursor = self._col.find(query, projection, batch_size=_READ_BATCH_SIZE)
+        cursor = cursor.sort("date", -1)
+        return TRAINING_LIST_ADAPTER.validate_python(await cursor.to_list(length=None))
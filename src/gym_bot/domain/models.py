@@ -2,7 +2,15 @@ from datetime import datetime
 from typing import Any, Optional
 
 from bson import ObjectId
-from pydantic import BaseModel, BeforeValidator, ConfigDict, Field, PlainSerializer, WithJsonSchema
+from pydantic import (
+    BaseModel,
+    BeforeValidator,
+    ConfigDict,
+    Field,
+    PlainSerializer,
+    TypeAdapter,
+    WithJsonSchema,
+)
 from typing_extensions import Annotated
 
 _BASE_CONFIG = ConfigDict(extra="ignore", populate_by_name=True, arbitrary_types_allowed=True)
@@ -53,3 +61,11 @@ class Training(BaseModel):
     date: datetime
     duration: int
     workouts: list[Workout] = []
+
+    def to_mongo(self) -> dict[str, Any]:
+        return self.model_dump(by_alias=True, exclude_none=True)
+
+
+# Validates a whole cursor's worth of documents in one pydantic-core call
+# instead of dispatching the Training schema once per document.
+TRAINING_LIST_ADAPTER = TypeAdapter(list[Training])
@@ -0,0 +1,6 @@
+from functools import lru_cache
+
+
+@lru_cache(maxsize=256)
+def display_name(name: str) -> str:
+    return name.replace("_", " ").title()
@@ -1,13 +1,13 @@
 import io
 import logging
+from collections.abc import Iterable
 from datetime import datetime
+from functools import lru_cache
 from typing import Any, Optional
 
-import matplotlib.dates as mdates
-import matplotlib.pyplot as plt
-
 from gym_bot.config.service import UserConfigService
 from gym_bot.db.repositories import TrainingRepository
+from gym_bot.domain.names import display_name
 
 logger = logging.getLogger(__name__)
 
@@ -28,6 +28,32 @@ REPORT_REGISTRY: dict[tuple[str, ...], list[tuple[str, str]]] = {
 
 REST_REPORT = ("rest_trend", "Rest")
 
+_METRIC_BITS: dict[str, int] = {
+    m: 1 << i for i, m in enumerate(sorted({m for req in REPORT_REGISTRY for m in req}))
+}
+
+
+def _metric_mask(metrics: Iterable[str]) -> int:
+    mask = 0
+    for m in metrics:
+        mask |= _METRIC_BITS.get(m, 0)
+    return mask
+
+
+_REGISTRY_MASKS = [(_metric_mask(req), reports) for req, reports in REPORT_REGISTRY.items()]
+
+
+@lru_cache(maxsize=64)
+def _available_reports(metrics: tuple[str, ...], track_rest: bool) -> tuple[tuple[str, str], ...]:
+    mask = _metric_mask(metrics)
+    reports = []
+    for required, report_list in _REGISTRY_MASKS:
+        if mask & required == required:
+            reports.extend(report_list)
+    if track_rest:
+        reports.append(REST_REPORT)
+    return tuple(sorted(set(reports)))
+
 
 class ExerciseReportingService:
     def __init__(self, training_repo: TrainingRepository, config_service: UserConfigService):
@@ -42,14 +68,7 @@ class ExerciseReportingService:
         if not exercise_config:
             return []
 
-        metrics = set(exercise_config.metrics)
-        reports = []
-        for required, report_list in REPORT_REGISTRY.items():
-            if metrics.issuperset(required):
-                reports.extend(report_list)
-        if exercise_config.track_rest:
-            reports.append(REST_REPORT)
-        return sorted(set(reports))
+        return list(_available_reports(tuple(exercise_config.metrics), exercise_config.track_rest))
 
     async def generate_report(
         self,
@@ -86,26 +105,10 @@ class ExerciseReportingService:
         if not relevant_workouts:
             return []
 
-        trainings = await self._repo.find_with_workout_filter(
-            user_id, t0, t1, include=relevant_workouts
+        return await self._repo.find_exercise_sessions(
+            user_id, exercise_name, relevant_workouts, t0, t1
         )
 
-        sessions = []
-        for training in trainings:
-            sets = []
-            rest = None
-            for workout in training.workouts:
-                if workout.name in relevant_workouts:
-                    for exercise in workout.exercises:
-                        if exercise.name == exercise_name:
-                            sets.extend(s.metrics for s in exercise.sets)
-                            if exercise.rest is not None:
-                                rest = exercise.rest
-            if sets:
-                sessions.append({"date": training.date, "sets": sets, "rest": rest})
-
-        return sorted(sessions, key=lambda x: x["date"])
-
     # --- Report generators ---
 
     def _report_total_reps(self, sessions: list[dict], exercise_name: str) -> dict:
@@ -119,7 +122,7 @@ class ExerciseReportingService:
         if not dates:
             return {"text": f"No reps data found for {exercise_name}."}
 
-        title = f"{_title(exercise_name)}: Reps per Session"
+        title = f"{display_name(exercise_name)}: Reps per Session"
         text = (
             f"*{title}*\n\n"
             f"Max reps in a day: *{max(values):,.0f}*\n"
@@ -138,7 +141,7 @@ class ExerciseReportingService:
         if not dates:
             return {"text": f"No volume data found for {exercise_name}."}
 
-        title = f"{_title(exercise_name)}: Volume (reps x kg)"
+        title = f"{display_name(exercise_name)}: Volume (reps x kg)"
         text = (
             f"*{title}*\n\n"
             f"*{len(dates)} sessions*\n"
@@ -157,7 +160,7 @@ class ExerciseReportingService:
         if not dates:
             return {"text": f"No weight data found for {exercise_name}."}
 
-        title = f"{_title(exercise_name)}: Max Weight (kg)"
+        title = f"{display_name(exercise_name)}: Max Weight (kg)"
         text = (
             f"*{title}*\n\n"
             f"All-time max: *{max(values):,.1f} kg*\n"
@@ -176,7 +179,7 @@ class ExerciseReportingService:
         if not dates:
             return {"text": f"No time data found for {exercise_name}."}
 
-        title = f"{_title(exercise_name)}: Total Time (s)"
+        title = f"{display_name(exercise_name)}: Total Time (s)"
         text = (
             f"*{title}*\n\n"
             f"Max total in a day: *{max(values)}s*\n"
@@ -194,7 +197,7 @@ class ExerciseReportingService:
         if not dates:
             return {"text": f"No rest data found for {exercise_name}."}
 
-        title = f"{_title(exercise_name)}: Rest (s)"
+        title = f"{display_name(exercise_name)}: Rest (s)"
         text = (
             f"*{title}*\n\n"
             f"Overall avg: *{sum(values) / len(values):,.0f}s*\n"
@@ -214,7 +217,7 @@ class ExerciseReportingService:
         if not dates:
             return {"text": f"No time data found for {exercise_name}."}
 
-        title = f"{_title(exercise_name)}: Max Hold (s)"
+        title = f"{display_name(exercise_name)}: Max Hold (s)"
         text = (
             f"*{title}*\n\n"
             f"All-time max: *{max(values)}s*\n"
@@ -225,10 +228,6 @@ class ExerciseReportingService:
 
 # --- Helpers ---
 
-def _title(exercise_name: str) -> str:
-    return exercise_name.replace("_", " ").title()
-
-
 _BAR_COLOR = "#2f5d8a"
 _GRID_COLOR = "#e8e8e8"
 _AXIS_COLOR = "#888888"
@@ -244,38 +243,49 @@ def _bar_chart(
     if not dates:
         return None
     try:
-        fig, ax = plt.subplots(figsize=(5.5, 7.5), dpi=160)
+        png = _render_bar_chart(tuple(dates), tuple(values), title, ylabel)
+    except Exception:
+        logger.error("Failed to generate chart", exc_info=True)
+        return None
+    return io.BytesIO(png)
 
-        ax.bar(dates, values, width=0.7, color=_BAR_COLOR, edgecolor="none", zorder=2)
 
-        ax.xaxis.set_major_locator(mdates.AutoDateLocator(maxticks=6))
-        ax.xaxis.set_major_formatter(mdates.DateFormatter("%d %b"))
+@lru_cache(maxsize=32)
+def _render_bar_chart(
+    dates: tuple[datetime, ...],
+    values: tuple[float, ...],
+    title: str,
+    ylabel: str,
+) -> bytes:
+    import matplotlib.dates as mdates
+    from matplotlib.figure import Figure
 
-        ax.set_title(title, fontsize=15, pad=16, color=_TEXT_COLOR, fontweight="semibold")
-        ax.set_ylabel(ylabel, fontsize=12, labelpad=10, color=_TEXT_COLOR)
+    fig = Figure(figsize=(5.5, 7.5), dpi=160)
+    ax = fig.subplots()
+    ax.bar(dates, values, width=0.7, color=_BAR_COLOR, edgecolor="none", zorder=2)
 
-        ax.spines["top"].set_visible(False)
-        ax.spines["right"].set_visible(False)
-        ax.spines["left"].set_color(_AXIS_COLOR)
-        ax.spines["bottom"].set_color(_AXIS_COLOR)
+    ax.xaxis.set_major_locator(mdates.AutoDateLocator(maxticks=6))
+    ax.xaxis.set_major_formatter(mdates.DateFormatter("%d %b"))
 
-        ax.tick_params(axis="both", colors=_AXIS_COLOR, labelsize=11, length=0)
-        ax.yaxis.grid(True, linestyle="-", linewidth=0.7, color=_GRID_COLOR, zorder=1)
-        ax.set_axisbelow(True)
-        ax.margins(x=0.05)
+    ax.set_title(title, fontsize=15, pad=16, color=_TEXT_COLOR, fontweight="semibold")
+    ax.set_ylabel(ylabel, fontsize=12, labelpad=10, color=_TEXT_COLOR)
 
-        for label in ax.get_xticklabels():
-            label.set_rotation(35)
-            label.set_horizontalalignment("right")
+    ax.spines["top"].set_visible(False)
+    ax.spines["right"].set_visible(False)
+    ax.spines["left"].set_color(_AXIS_COLOR)
+    ax.spines["bottom"].set_color(_AXIS_COLOR)
 
-        fig.tight_layout()
+    ax.tick_params(axis="both", colors=_AXIS_COLOR, labelsize=11, length=0)
+    ax.yaxis.grid(True, linestyle="-", linewidth=0.7, color=_GRID_COLOR, zorder=1)
+    ax.set_axisbelow(True)
+    ax.margins(x=0.05)
 
-        buf = io.BytesIO()
-        fig.savefig(buf, format="png", bbox_inches="tight", facecolor="white")
-        buf.seek(0)
-        return buf
-    except Exception:
-        logger.error("Failed to generate chart", exc_info=True)
-        return None
-    finally:
-        plt.close(fig)
+    for label in ax.get_xticklabels():
+        label.set_rotation(35)
+        label.set_horizontalalignment("right")
+
+    fig.tight_layout()
+
+    buf = io.BytesIO()
+    fig.savefig(buf, format="png", bbox_inches="tight", facecolor="white")
+    return buf.getvalue()
@@ -3,15 +3,15 @@ import io
 import logging
 import re
 from datetime import date, datetime, timedelta
+from functools import lru_cache
 from typing import Optional
 
-import matplotlib.patches as mpatches
-import matplotlib.pyplot as plt
+from cachetools import TTLCache
 from dateutil.relativedelta import relativedelta
-from matplotlib.colors import LinearSegmentedColormap, Normalize
 
 from gym_bot.db.repositories import TrainingRepository
 from gym_bot.domain.models import Training
+from gym_bot.domain.names import display_name
 from gym_bot.settings import Settings
 
 logger = logging.getLogger(__name__)
@@ -19,16 +19,20 @@ logger = logging.getLogger(__name__)
 _NO_TRAINING_COLOR = "#ebedf0"
 _HEATMAP_TEXT_COLOR = "#444444"
 _HEATMAP_AXIS_COLOR = "#888888"
-_HEATMAP_CMAP = LinearSegmentedColormap.from_list(
-    "training_greens",
-    [plt.cm.Greens(0.20), plt.cm.Greens(0.95)],
-)
 
 
 class ReportingService:
     def __init__(self, training_repo: TrainingRepository, settings: Settings):
         self._repo = training_repo
         self._settings = settings
+        self._calendar_cache: TTLCache[tuple[int, int, int, Optional[str]], str] = TTLCache(
+            maxsize=1024, ttl=settings.calendar_cache_ttl
+        )
+
+    def invalidate_calendar(self, user_id: int, day: datetime) -> None:
+        month = (user_id, day.year, day.month)
+        for key in [k for k in self._calendar_cache if k[:3] == month]:
+            self._calendar_cache.pop(key, None)
 
     async def generate_activity_calendar(
         self,
@@ -37,45 +41,26 @@ class ReportingService:
         month: int,
         workout_filter: Optional[str],
     ) -> str | None:
+        key = (user_id, year, month, workout_filter)
+        cached = self._calendar_cache.get(key)
+        if cached is not None:
+            return cached
+
         t0 = datetime(year, month, 1)
-        t1 = (t0 + timedelta(days=32)).replace(day=1)
+        t1 = datetime(year + month // 12, month % 12 + 1, 1)
 
         if workout_filter:
-            trainings = await self._repo.find_with_workout_filter(
+            training_days = await self._repo.find_training_days(
                 user_id, t0, t1, include=[workout_filter]
             )
         else:
-            trainings = await self._repo.find_with_workout_filter(
+            training_days = await self._repo.find_training_days(
                 user_id, t0, t1, exclude=self._settings.excluded_workouts
             )
 
-        # Map day -> completed status
-        training_days: dict[int, bool] = {}
-        for training in trainings:
-            day = training.date.day
-            all_completed = all(w.completed for w in training.workouts)
-            training_days[day] = training_days.get(day, True) and all_completed
-
-        cal = calendar.TextCalendar(calendar.MONDAY)
-        month_calendar = cal.formatmonth(year, month).split("\n")
-
-        month_name = t0.strftime("%B %Y")
-        header = f"Activity for {month_name}\n"
-        calendar_str = f"```\n{month_calendar[0]}\n{month_calendar[1]}\n"
-
-        for line in month_calendar[2:]:
-            if not line.strip():
-                continue
-            new_line = line
-            for day_num, completed in training_days.items():
-                day_str = f"{day_num: >2}"
-                marker = "🟢" if completed else "🔶"
-                pattern = rf"(?<!\d){re.escape(day_str)}(?!\d)"
-                new_line = re.sub(pattern, marker, new_line)
-            calendar_str += new_line + "\n"
-
-        calendar_str += "```"
-        return header + calendar_str
+        calendar_str = _render_calendar(year, month, frozenset(training_days.items()))
+        self._calendar_cache[key] = calendar_str
+        return calendar_str
 
     async def generate_duration_heatmap(
         self,
@@ -91,16 +76,16 @@ class ReportingService:
         t1 = datetime(end_date.year, end_date.month, end_date.day) + timedelta(days=1)
 
         if workout_filter:
-            trainings = await self._repo.find_with_workout_filter(
+            trainings = self._repo.iter_summaries_with_workout_filter(
                 user_id, t0, t1, include=[workout_filter]
             )
         else:
-            trainings = await self._repo.find_with_workout_filter(
+            trainings = self._repo.iter_summaries_with_workout_filter(
                 user_id, t0, t1, exclude=self._settings.excluded_workouts
             )
 
         day_durations: dict[date, int] = {}
-        for training in trainings:
+        async for training in trainings:
             day = training.date.date()
             if start_date <= day <= end_date:
                 day_durations[day] = day_durations.get(day, 0) + training.duration
@@ -120,22 +105,23 @@ class ReportingService:
 
         for workout in training.workouts:
             status = "completed" if workout.completed else "not completed"
-            lines.append(f"*{workout.name.replace('_', ' ').title()}* ({status})")
+            lines.append(f"*{display_name(workout.name)}* ({status})")
 
             if not workout.exercises:
                 lines.append("  _No exercises logged_")
                 continue
 
             for exercise in workout.exercises:
+                name = display_name(exercise.name)
                 if not exercise.sets:
-                    lines.append(f"  *{exercise.name.replace('_', ' ').title()}* (No sets)")
+                    lines.append(f"  *{name}* (No sets)")
                     continue
 
                 metric_keys = ", ".join(exercise.sets[0].metrics.keys())
-                lines.append(f"  *{exercise.name.replace('_', ' ').title()}* ({metric_keys})")
+                lines.append(f"  *{name}* ({metric_keys})")
 
                 for i, s in enumerate(exercise.sets, start=1):
-                    values = ", ".join(str(v) for v in s.metrics.values())
+                    values = ", ".join(map(str, s.metrics.values()))
                     lines.append(f"       #{i} → {values}")
 
             lines.append("")
@@ -143,11 +129,53 @@ class ReportingService:
         return "\n".join(lines).strip()
 
 
+@lru_cache(maxsize=256)
+def _render_calendar(year: int, month: int, days: frozenset[tuple[int, bool]]) -> str:
+    header, *lines = _month_skeleton(year, month)
+    parts = ["```", *lines[:2]]
+
+    markers = {f"{day: >2}": "🟢" if completed else "🔶" for day, completed in days}
+    alternation = "|".join(re.escape(d) for d in markers)
+    pattern = re.compile(rf"(?<!\d)(?:{alternation})(?!\d)") if markers else None
+
+    for line in lines[2:]:
+        if pattern is not None:
+            line = pattern.sub(lambda m: markers[m.group()], line)
+        parts.append(line)
+
+    parts.append("```")
+    return header + "\n".join(parts)
+
+
+@lru_cache(maxsize=12)
+def _month_skeleton(year: int, month: int) -> tuple[str, ...]:
+    cal = calendar.TextCalendar(calendar.MONDAY)
+    lines = [line for line in cal.formatmonth(year, month).split("\n") if line.strip()]
+    header = f"Activity for {date(year, month, 1).strftime('%B %Y')}\n"
+    return (header, *lines)
+
+
+@lru_cache(maxsize=1)
+def _heatmap_cmap():
+    import matplotlib.pyplot as plt
+    from matplotlib.colors import LinearSegmentedColormap
+
+    return LinearSegmentedColormap.from_list(
+        "training_greens",
+        [plt.cm.Greens(0.20), plt.cm.Greens(0.95)],
+    )
+
+
 def _duration_heatmap(
     day_durations: dict[date, int],
     start_date: date,
     end_date: date,
 ) -> Optional[io.BytesIO]:
+    import matplotlib.patches as mpatches
+    import matplotlib.pyplot as plt
+    from matplotlib.colors import Normalize
+
+    cmap = _heatmap_cmap()
     grid_start = start_date - timedelta(days=start_date.weekday())
 
     weeks: list[list[date]] = []
@@ -166,7 +194,7 @@ def _duration_heatmap(
         dur = day_durations.get(d, 0)
         if dur == 0:
             return _NO_TRAINING_COLOR
-        return _HEATMAP_CMAP(norm(dur))
+        return cmap(norm(dur))
 
     fig_w = max(4.0, n_weeks * 0.38 + 1.8)
     fig_h = 2.4
@@ -208,7 +236,7 @@ def _duration_heatmap(
         ax.set_ylim(-0.2, 7.8)
         ax.axis("off")
 
-        sm = plt.cm.ScalarMappable(cmap=_HEATMAP_CMAP, norm=norm)
+        sm = plt.cm.ScalarMappable(cmap=cmap, norm=norm)
         sm.set_array([])
         cbar = fig.colorbar(sm, ax=ax, orientation="vertical",
                             fraction=0.025, pad=0.01, shrink=0.75)
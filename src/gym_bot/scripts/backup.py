@@ -2,18 +2,17 @@
 
 Usage:
     python -m gym_bot.scripts.backup download
-    python -m gym_bot.scripts.backup upload <path>
+    python -m gym_bot.scripts.backup upload [--fast] <path>
 """
 
 import argparse
 import asyncio
-import json
 import logging
 import os
 import sys
-from datetime import date, datetime
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 
-from bson import ObjectId
+from pymongo.errors import BulkWriteError
 
 from gym_bot.db.mongo import Database
 from gym_bot.db.repositories import TrainingRepository
@@ -26,67 +25,105 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-
-def _json_serializer(obj):
-    if isinstance(obj, (datetime, date)):
-        return obj.isoformat()
-    if isinstance(obj, ObjectId):
-        return str(obj)
-    raise TypeError(f"Type {type(obj)} not serializable")
+_UPLOAD_BATCH_SIZE = 200
+_UPLOAD_CONCURRENCY = 16
+_IO_WORKERS = 16
+_MAX_PENDING_WRITES = _IO_WORKERS * 4
+_PARSE_CHUNKSIZE = 32
+
+
+def _write_backup(backup_dir: str, training: Training) -> None:
+    filename = f"{training.date.date().isoformat()}_{training.id}.json"
+    filepath = os.path.join(backup_dir, filename)
+    with open(filepath, "w", encoding="utf-8") as f:
+        f.write(training.model_dump_json(by_alias=True, exclude_none=True, indent=2))
+
+
+def _read_backup(filepath: str) -> Training | None:
+    try:
+        with open(filepath, "rb") as f:
+            return Training.model_validate_json(f.read())
+    except Exception:
+        logger.error("Failed to parse %s", filepath, exc_info=True)
+        return None
+
+
+async def _upload_batch(repo: TrainingRepository, batch: list[Training], acknowledged: bool) -> int:
+    try:
+        return await repo.upsert_many(batch, acknowledged=acknowledged)
+    except BulkWriteError as e:
+        # Unordered writes: the rest of the batch was applied before the error.
+        for error in e.details["writeErrors"]:
+            logger.error(
+                "Failed to upload training %s: %s", batch[error["index"]].id, error["errmsg"]
+            )
+        return e.details["nMatched"] + e.details["nUpserted"]
+    except Exception:
+        logger.error("Failed to upload batch of %d trainings", len(batch), exc_info=True)
+        return 0
 
 
 async def download(settings: Settings):
-    db = Database(settings.mongo_uri, settings.mongo_database)
+    db = Database.from_settings(settings)
     repo = TrainingRepository(db)
 
     backup_dir = "trainings_backup"
     os.makedirs(backup_dir, exist_ok=True)
 
-    trainings = await repo.find_all()
-    if not trainings:
+    loop = asyncio.get_running_loop()
+    pending: set[asyncio.Future] = set()
+    count = 0
+    with ThreadPoolExecutor(max_workers=_IO_WORKERS) as pool:
+        async for training in repo.iter_all():
+            # Stop reading the cursor while the disk catches up, so slow
+            # writes cannot queue up every training in memory.
+            if len(pending) >= _MAX_PENDING_WRITES:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for future in done:
+                    future.result()
+            pending.add(loop.run_in_executor(pool, _write_backup, backup_dir, training))
+            count += 1
+        for future in pending:
+            await future
+
+    if count:
+        logger.info("Downloaded %d files to %s", count, backup_dir)
+    else:
         logger.warning("No trainings to download")
-        return
-
-    logger.info("Downloading %d trainings", len(trainings))
-    for training in trainings:
-        doc = training.model_dump(by_alias=True, exclude_none=True)
-        filename = f"{training.date.strftime('%Y-%m-%d')}_{training.id}.json"
-        filepath = os.path.join(backup_dir, filename)
-        with open(filepath, "w", encoding="utf-8") as f:
-            json.dump(doc, f, default=_json_serializer, indent=2)
-
-    logger.info("Downloaded %d files to %s", len(trainings), backup_dir)
     db.close()
 
 
-async def upload(settings: Settings, path: str):
-    db = Database(settings.mongo_uri, settings.mongo_database)
+async def upload(settings: Settings, path: str, fast: bool = False):
+    db = Database.from_settings(settings)
     repo = TrainingRepository(db)
-    col = db.trainings
 
     files = []
     if os.path.isfile(path) and path.endswith(".json"):
         files = [path]
     elif os.path.isdir(path):
-        files = [os.path.join(path, f) for f in os.listdir(path) if f.endswith(".json")]
+        with os.scandir(path) as entries:
+            files = [e.path for e in entries if e.name.endswith(".json") and e.is_file()]
     else:
         logger.error("Invalid path: %s", path)
         sys.exit(1)
 
-    success, failed = 0, 0
-    for filepath in files:
-        try:
-            with open(filepath, "r", encoding="utf-8") as f:
-                data = json.load(f)
-            training = Training(**data)
-            doc = training.model_dump(mode="python", by_alias=True)
-            await col.replace_one(
-                {"_id": training.id}, doc, upsert=True
-            )
-            success += 1
-        except Exception:
-            logger.error("Failed to upload %s", filepath, exc_info=True)
-            failed += 1
+    with ProcessPoolExecutor() as pool:
+        parsed = list(pool.map(_read_backup, files, chunksize=_PARSE_CHUNKSIZE))
+    trainings = [t for t in parsed if t is not None]
+    failed = len(parsed) - len(trainings)
+
+    limit = asyncio.Semaphore(_UPLOAD_CONCURRENCY)
+
+    async def upload_batch(batch: list[Training]) -> int:
+        async with limit:
+            return await _upload_batch(repo, batch, acknowledged=not fast)
+
+    batches = [
+        trainings[i : i + _UPLOAD_BATCH_SIZE] for i in range(0, len(trainings), _UPLOAD_BATCH_SIZE)
+    ]
+    results = await asyncio.gather(*(upload_batch(batch) for batch in batches))
+    success = sum(results)
+    failed += len(trainings) - success
 
     logger.info("Upload complete: %d ok, %d failed", success, failed)
     db.close()
@@ -98,6 +135,11 @@ def main():
     sub.add_parser("download")
     up = sub.add_parser("upload")
     up.add_argument("path", help="JSON file or directory")
+    up.add_argument(
+        "--fast",
+        action="store_true",
+        help="Skip write acknowledgements (w=0); server-side failures go unreported",
+    )
     args = parser.parse_args()
 
     settings = Settings()
@@ -105,7 +147,7 @@ def main():
     if args.command == "download":
         asyncio.run(download(settings))
     elif args.command == "upload":
-        asyncio.run(upload(settings, args.path))
+        asyncio.run(upload(settings, args.path, args.fast))
     else:
         parser.print_help()
 
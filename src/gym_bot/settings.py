@@ -1,12 +1,19 @@
+from typing import Literal
+
 from pydantic_settings import BaseSettings
 
 
 class Settings(BaseSettings):
     telegram_token: str
+    telegram_http_version: Literal["1.1", "2"] = "1.1"
     mongo_uri: str = "mongodb://localhost:27017/"
     mongo_database: str = "gym-bot"
+    mongo_max_pool_size: int = 50
+    mongo_min_pool_size: int = 5
     default_config_path: str = "training_config_default.yaml"
-    excluded_workouts: list[str] = ["home"]
+    excluded_workouts: frozenset[str] = frozenset({"home"})
     owner_user_id: int | None = None
+    config_cache_ttl: int = 300
+    calendar_cache_ttl: int = 300
 
     model_config = {"env_prefix": "GYMBOT_", "env_file": ".env"}
@@ -0,0 +1,28 @@
+from gym_bot.bot.callbacks import ADD_WORKOUT, FINISH_TRAINING, make_callback
+from gym_bot.bot.keyboards import chunk_buttons, completion_keyboard, workout_selection_keyboard
+
+
+def test_chunk_buttons_splits_into_rows_of_given_size():
+    assert chunk_buttons([1, 2, 3, 4, 5], 2) == [[1, 2], [3, 4], [5]]
+
+
+def test_workout_selection_keyboard_lays_out_workouts_then_finish_row():
+    keyboard = workout_selection_keyboard(["pull", "push", "lower", "run"])
+
+    rows = keyboard.inline_keyboard
+    assert [b.callback_data for b in rows[0]] == [
+        make_callback(ADD_WORKOUT, n) for n in ("pull", "push", "lower")
+    ]
+    assert rows[-1][0].callback_data == make_callback(FINISH_TRAINING, "")
+
+
+def test_workout_selection_keyboard_is_reused_for_same_workouts():
+    first = workout_selection_keyboard(["pull", "push"])
+    second = workout_selection_keyboard(["pull", "push"])
+
+    assert first is second
+    assert workout_selection_keyboard(["push", "pull"]) is not first
+
+
+def test_completion_keyboard_is_built_once():
+    assert completion_keyboard() is completion_keyboard()
@@ -26,6 +26,8 @@ def test_exercise_config_accepts_known_metrics():
 
     assert cfg.metrics == ["reps", "weight"]
     assert cfg.track_rest is False
+    assert cfg.value_types == (int, float)
+    assert cfg.metric_prompt == "<reps> <weight(kg)>"
 
 
 def test_exercise_config_rejects_unknown_metric():
@@ -83,3 +85,16 @@ def test_workout_names_lists_all_workouts():
     cfg = _make_config()
 
     assert set(cfg.workout_names) == {"pull", "handstand"}
+
+
+def test_workouts_by_exercise_indexes_each_workout_once_in_declared_order():
+    cfg = _make_config(
+        exercises={
+            "pushup": ExerciseConfig(metrics=["reps"]),
+            "dip": ExerciseConfig(metrics=["reps"]),
+        },
+        workouts={"push": ["pushup", "dip", "pushup"], "home": ["pushup"], "empty": []},
+    )
+
+    assert cfg.workouts_by_exercise == {"pushup": ["push", "home"], "dip": ["push"]}
+    assert cfg.workouts_by_exercise is cfg.workouts_by_exercise
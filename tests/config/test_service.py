@@ -1,8 +1,11 @@
+import os
+from pathlib import Path
 from types import SimpleNamespace
 from unittest.mock import AsyncMock
 
 import pytest
 
+from gym_bot.config import service as service_module
 from gym_bot.config.service import UserConfigService
 
 _YAML = """
@@ -24,7 +27,7 @@ def yaml_file(tmp_path):
 def _fake_db(find_return=None) -> SimpleNamespace:
     collection = SimpleNamespace(
         find_one=AsyncMock(return_value=find_return),
-        update_one=AsyncMock(),
+        replace_one=AsyncMock(),
     )
     return SimpleNamespace(user_configs=collection)
 
@@ -38,8 +41,8 @@ async def test_get_config_seeds_new_user_from_yaml(yaml_file):
     assert config.user_id == 42
     assert "pullup" in config.exercises
     assert config.workouts == {"pull": ["pullup", "row"]}
-    db.user_configs.update_one.assert_awaited_once()
-    _, kwargs = db.user_configs.update_one.call_args
+    db.user_configs.replace_one.assert_awaited_once()
+    _, kwargs = db.user_configs.replace_one.call_args
     assert kwargs["upsert"] is True
 
 
@@ -58,7 +61,9 @@ async def test_get_config_parses_existing_document_without_touching_yaml(tmp_pat
 
     assert config.user_id == 7
     assert config.get_exercise("pullup").metrics == ["reps"]
-    db.user_configs.update_one.assert_not_awaited()
+    db.user_configs.replace_one.assert_not_awaited()
+    _, projection = db.user_configs.find_one.call_args.args
+    assert projection["_id"] == 0
 
 
 async def test_get_config_uses_cache_on_second_call(yaml_file):
@@ -78,7 +83,7 @@ async def test_sync_owner_is_noop_when_owner_not_set(yaml_file):
 
     await svc.sync_owner()
 
-    db.user_configs.update_one.assert_not_awaited()
+    db.user_configs.replace_one.assert_not_awaited()
 
 
 async def test_sync_owner_upserts_and_caches_when_owner_set(yaml_file):
@@ -87,8 +92,58 @@ async def test_sync_owner_upserts_and_caches_when_owner_set(yaml_file):
 
     await svc.sync_owner()
 
-    db.user_configs.update_one.assert_awaited_once()
+    db.user_configs.replace_one.assert_awaited_once()
     # Subsequent get_config should serve from cache — no DB lookup.
     config = await svc.get_config(user_id=99)
     assert config.user_id == 99
     db.user_configs.find_one.assert_not_awaited()
+
+
+async def test_yaml_is_parsed_once_while_file_is_unchanged(yaml_file, monkeypatch):
+    calls = []
+    real_load = service_module.yaml.load
+
+    def counting_load(*args, **kwargs):
+        calls.append(1)
+        return real_load(*args, **kwargs)
+
+    monkeypatch.setattr(service_module.yaml, "load", counting_load)
+    db = _fake_db(find_return=None)
+    svc = UserConfigService(db, yaml_file, owner_user_id=None)
+
+    await svc.get_config(user_id=1)
+    await svc.get_config(user_id=2)
+
+    assert len(calls) == 1
+
+
+async def test_yaml_is_reparsed_after_file_changes(yaml_file):
+    db = _fake_db(find_return=None)
+    svc = UserConfigService(db, yaml_file, owner_user_id=None)
+    await svc.get_config(user_id=1)
+
+    path = Path(yaml_file)
+    path.write_text(_YAML.replace("pull: [pullup, row]", "pull: [row]"))
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    config = await svc.get_config(user_id=2)
+
+    assert config.workouts == {"pull": ["row"]}
+
+
+async def test_cached_config_is_refetched_after_ttl_expires(yaml_file):
+    now = [0.0]
+    db = _fake_db(find_return=None)
+    svc = UserConfigService(
+        db, yaml_file, owner_user_id=None, cache_ttl=60, timer=lambda: now[0]
+    )
+
+    await svc.get_config(user_id=1)
+    now[0] = 59
+    await svc.get_config(user_id=1)
+    assert db.user_configs.find_one.await_count == 1
+
+    now[0] = 61
+    await svc.get_config(user_id=1)
+    assert db.user_configs.find_one.await_count == 2
@@ -0,0 +1,28 @@
+from unittest.mock import AsyncMock
+
+from pymongo.errors import OperationFailure
+
+from gym_bot.db.mongo import Database
+
+
+def _db() -> Database:
+    db = Database.__new__(Database)
+    db.db = {"trainings": AsyncMock(), "user_configs": AsyncMock()}
+    return db
+
+
+async def test_ensure_indexes_drops_superseded_user_date_index():
+    db = _db()
+
+    await db.ensure_indexes()
+
+    db.trainings.drop_index.assert_awaited_once_with("user_id_1_date_1")
+
+
+async def test_ensure_indexes_tolerates_missing_legacy_index():
+    db = _db()
+    db.trainings.drop_index.side_effect = OperationFailure("index not found", code=27)
+
+    await db.ensure_indexes()
+
+    assert db.trainings.create_index.await_count == 2
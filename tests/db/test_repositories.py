@@ -0,0 +1,204 @@
+from datetime import datetime
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import mongomock
+from bson import ObjectId
+from pymongo import ReplaceOne
+
+from gym_bot.db.repositories import TrainingRepository
+from gym_bot.domain.models import Training
+
+
+def _repo(collection) -> TrainingRepository:
+    return TrainingRepository(SimpleNamespace(trainings=collection))
+
+
+def _training(**overrides) -> Training:
+    base = dict(_id=ObjectId(), user_id=1, date=datetime(2026, 4, 1), duration=45)
+    base.update(overrides)
+    return Training(**base)
+
+
+async def test_upsert_many_sends_one_unordered_bulk_write():
+    col = SimpleNamespace(
+        bulk_write=AsyncMock(return_value=SimpleNamespace(matched_count=1, upserted_count=1))
+    )
+    trainings = [_training(), _training()]
+
+    count = await _repo(col).upsert_many(trainings)
+
+    assert count == 2
+    col.bulk_write.assert_awaited_once()
+    ops, = col.bulk_write.call_args.args
+    assert ops == [
+        ReplaceOne({"_id": t.id}, t.to_mongo(), upsert=True) for t in trainings
+    ]
+    assert col.bulk_write.call_args.kwargs["ordered"] is False
+
+
+async def test_upsert_many_skips_round_trip_when_empty():
+    col = SimpleNamespace(bulk_write=AsyncMock())
+
+    assert await _repo(col).upsert_many([]) == 0
+    col.bulk_write.assert_not_awaited()
+
+
+class _FakeCursor:
+    def __init__(self, docs):
+        self._docs = docs
+
+    def sort(self, *args):
+        return self
+
+    async def to_list(self, length=None):
+        return list(self._docs)
+
+    def __aiter__(self):
+        return self._iter()
+
+    async def _iter(self):
+        for doc in self._docs:
+            yield doc
+
+
+async def test_iter_all_streams_cursor_with_batch_size():
+    docs = [_training().to_mongo(), _training().to_mongo()]
+    calls = []
+
+    def find(**kwargs):
+        calls.append(kwargs)
+        return _FakeCursor(docs)
+
+    repo = _repo(SimpleNamespace(find=find))
+
+    trainings = [t async for t in repo.iter_all(batch_size=50)]
+
+    assert [t.id for t in trainings] == [d["_id"] for d in docs]
+    assert calls[0]["batch_size"] == 50
+    assert set(calls[0]["projection"]) == {"_id", *Training.model_fields} - {"id"}
+
+
+async def test_summaries_are_projected_partial_trainings():
+    full = _training(workouts=[{"name": "pull", "completed": True, "exercises": [{"name": "x"}]}])
+    summary = {k: v for k, v in full.to_mongo().items() if k != "workouts"}
+    summary["workouts"] = [{"name": "pull", "completed": True}]
+    calls = []
+
+    def find(query, projection=None, batch_size=None):
+        calls.append(projection)
+        return _FakeCursor([summary])
+
+    trainings = await _repo(SimpleNamespace(find=find)).find_summaries_between_dates(
+        1, datetime(2026, 4, 1), datetime(2026, 4, 2)
+    )
+
+    assert "workouts.name" in calls[0] and "workouts" not in calls[0]
+    assert trainings[0].workouts[0].name == "pull"
+    assert trainings[0].workouts[0].exercises == []
+
+
+async def test_iter_summaries_with_workout_filter_streams_filtered_cursor():
+    docs = [_training().to_mongo()]
+    calls = []
+
+    def find(query, projection=None, batch_size=None):
+        calls.append((query, batch_size))
+        return _FakeCursor(docs)
+
+    repo = _repo(SimpleNamespace(find=find))
+
+    trainings = [
+        t
+        async for t in repo.iter_summaries_with_workout_filter(
+            1, datetime(2026, 4, 1), datetime(2026, 5, 1), exclude=frozenset({"home"})
+        )
+    ]
+
+    assert [t.id for t in trainings] == [docs[0]["_id"]]
+    query, batch_size = calls[0]
+    assert query["workouts.name"] == {"$nin": ["home"]}
+    assert set(query["date"]) == {"$gte", "$lt"}
+    assert batch_size is not None
+
+
+async def test_upsert_many_unacknowledged_uses_w0_collection():
+    fast_col = SimpleNamespace(bulk_write=AsyncMock(return_value=SimpleNamespace()))
+    concerns = []
+
+    def with_options(write_concern):
+        concerns.append(write_concern)
+        return fast_col
+
+    col = SimpleNamespace(bulk_write=AsyncMock(), with_options=with_options)
+
+    count = await _repo(col).upsert_many([_training(), _training()], acknowledged=False)
+
+    assert count == 2
+    assert [c.document for c in concerns] == [{"w": 0}]
+    fast_col.bulk_write.assert_awaited_once()
+    col.bulk_write.assert_not_awaited()
+
+
+class _MongomockCollection:
+    # Runs pipelines for real on mongomock behind motor's async cursor API.
+    def __init__(self, docs):
+        self._col = mongomock.MongoClient().db.trainings
+        self._col.insert_many(docs)
+
+    def aggregate(self, pipeline):
+        return _FakeCursor(list(self._col.aggregate(pipeline)))
+
+
+def _doc(day: int, *workouts: dict) -> dict:
+    return {
+        "user_id": 1,
+        "date": datetime(2026, 4, day, 18),
+        "duration": 45,
+        "workouts": list(workouts),
+    }
+
+
+def _workout(name: str, completed: bool = True, *exercises: dict) -> dict:
+    return {"name": name, "completed": completed, "exercises": list(exercises)}
+
+
+def _exercise(rest=None, *reps: int) -> dict:
+    return {"name": "pullup", "rest": rest, "sets": [{"metrics": {"reps": r}} for r in reps]}
+
+
+async def test_exercise_sessions_group_sets_and_take_last_rest():
+    col = _MongomockCollection([
+        _doc(2, _workout("pull", True, _exercise(90, 5, 6), _exercise(60))),
+        _doc(
+            1,
+            _workout("pull", True, _exercise(None, 8)),
+            _workout("push", True, _exercise(30, 1)),
+        ),
+        _doc(3, _workout("pull", True, _exercise(45))),
+    ])
+
+    sessions = await _repo(col).find_exercise_sessions(
+        1, "pullup", ["pull"], datetime(2026, 4, 1), datetime(2026, 5, 1)
+    )
+
+    assert sessions == [
+        {"date": datetime(2026, 4, 1, 18), "sets": [{"reps": 8}], "rest": None},
+        {"date": datetime(2026, 4, 2, 18), "sets": [{"reps": 5}, {"reps": 6}], "rest": 60},
+    ]
+
+
+async def test_training_days_flag_day_incomplete_if_any_workout_was_not_completed():
+    col = _MongomockCollection([
+        _doc(3, _workout("pull")),
+        _doc(3, _workout("push", False)),
+        _doc(5, _workout("pull"), _workout("push")),
+        _doc(7),
+        _doc(9, _workout("home")),
+    ])
+
+    days = await _repo(col).find_training_days(
+        1, datetime(2026, 4, 1), datetime(2026, 5, 1), exclude=["home"]
+    )
+
+    assert days == {3: False, 5: True, 7: True}
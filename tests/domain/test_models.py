@@ -2,7 +2,13 @@ from datetime import datetime
 
 from bson import ObjectId
 
-from gym_bot.domain.models import Exercise, ExerciseSet, Training, Workout
+from gym_bot.domain.models import (
+    TRAINING_LIST_ADAPTER,
+    Exercise,
+    ExerciseSet,
+    Training,
+    Workout,
+)
 
 
 def test_exercise_set_accepts_mixed_int_float_metrics():
@@ -69,3 +75,38 @@ def test_models_ignore_extra_fields():
     ex = Exercise(name="pullup", sets=[], not_a_field="ignored")
 
     assert not hasattr(ex, "not_a_field")
+
+
+def test_training_list_adapter_validates_mongo_documents_in_bulk():
+    docs = [
+        {"_id": ObjectId(), "user_id": 1, "date": datetime(2026, 4, d), "duration": 30}
+        for d in (1, 2)
+    ]
+
+    trainings = TRAINING_LIST_ADAPTER.validate_python(docs)
+
+    assert [t.id for t in trainings] == [d["_id"] for d in docs]
+    assert all(isinstance(t, Training) for t in trainings)
+
+
+def test_to_mongo_uses_id_alias_and_drops_unset_fields():
+    oid = ObjectId()
+    training = Training(
+        _id=oid,
+        user_id=1,
+        date=datetime(2026, 4, 1),
+        duration=30,
+        workouts=[Workout(name="pull", completed=True, exercises=[Exercise(name="pullup")])],
+    )
+
+    doc = training.to_mongo()
+
+    assert doc["_id"] is oid
+    assert "id" not in doc
+    assert "rest" not in doc["workouts"][0]["exercises"][0]
+
+
+def test_to_mongo_omits_id_for_unsaved_training():
+    training = Training(user_id=1, date=datetime(2026, 4, 1), duration=30)
+
+    assert "_id" not in training.to_mongo()
@@ -8,7 +8,11 @@ import pytest
 matplotlib.use("Agg")
 
 from gym_bot.config.models import ExerciseConfig, UserConfig
-from gym_bot.reporting.exercise_reports import ExerciseReportingService
+from gym_bot.reporting.exercise_reports import (
+    ExerciseReportingService,
+    _bar_chart,
+    _render_bar_chart,
+)
 
 
 def _svc() -> ExerciseReportingService:
@@ -200,3 +204,56 @@ async def test_get_available_reports_returns_empty_for_unknown_exercise():
     reports = await svc.get_available_reports(user_id=1, exercise_name="nope")
 
     assert reports == []
+
+
+async def test_exercise_sessions_are_fetched_for_workouts_containing_the_exercise():
+    config = UserConfig(
+        user_id=1,
+        exercises={
+            "pullup": ExerciseConfig(metrics=["reps"]),
+            "row": ExerciseConfig(metrics=["reps"]),
+        },
+        workouts={"pull": ["pullup", "row"], "home": ["pullup"], "back": ["row"]},
+    )
+    config_service = AsyncMock()
+    config_service.get_config.return_value = config
+    repo = AsyncMock()
+    repo.find_exercise_sessions.return_value = _sessions([[{"reps": 5}]])
+    svc = ExerciseReportingService(training_repo=repo, config_service=config_service)
+    t0, t1 = datetime(2026, 4, 1), datetime(2026, 5, 1)
+
+    sessions = await svc._get_exercise_sessions(1, "pullup", t0, t1)
+
+    assert sessions == repo.find_exercise_sessions.return_value
+    repo.find_exercise_sessions.assert_awaited_once_with(1, "pullup", ["pull", "home"], t0, t1)
+
+
+async def test_exercise_sessions_skip_query_when_no_workout_contains_exercise():
+    config = UserConfig(
+        user_id=1,
+        exercises={"pullup": ExerciseConfig(metrics=["reps"])},
+        workouts={},
+    )
+    config_service = AsyncMock()
+    config_service.get_config.return_value = config
+    repo = AsyncMock()
+    svc = ExerciseReportingService(training_repo=repo, config_service=config_service)
+
+    sessions = await svc._get_exercise_sessions(
+        1, "pullup", datetime(2026, 4, 1), datetime(2026, 5, 1)
+    )
+
+    assert sessions == []
+    repo.find_exercise_sessions.assert_not_awaited()
+
+
+def test_identical_charts_are_rendered_once():
+    _render_bar_chart.cache_clear()
+    dates = [datetime(2026, 4, 1), datetime(2026, 4, 2)]
+
+    first = _bar_chart(dates, [10, 12], "Pullup", "Reps")
+    second = _bar_chart(list(dates), [10, 12], "Pullup", "Reps")
+
+    assert first.getvalue() == second.getvalue()
+    assert first is not second
+    assert _render_bar_chart.cache_info().misses == 1
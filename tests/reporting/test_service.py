@@ -1,12 +1,20 @@
 from datetime import datetime
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
 
 from gym_bot.domain.models import Exercise, ExerciseSet, Training, Workout
 from gym_bot.reporting.service import ReportingService
 
 
+def _settings(**overrides) -> SimpleNamespace:
+    base = dict(excluded_workouts=frozenset({"home"}), calendar_cache_ttl=300)
+    base.update(overrides)
+    return SimpleNamespace(**base)
+
+
 def _svc() -> ReportingService:
-    # Neither method under test touches the repo or settings.
-    return ReportingService(training_repo=None, settings=None)  # type: ignore[arg-type]
+    # Neither formatting method touches the repo.
+    return ReportingService(training_repo=None, settings=_settings())  # type: ignore[arg-type]
 
 
 def _training(**overrides) -> Training:
@@ -95,3 +103,41 @@ def test_format_training_details_numbers_sets_from_one():
     assert "#1 → 10" in out
     assert "#2 → 8" in out
     assert "#3 → 6" in out
+
+
+async def test_activity_calendar_marks_days_from_repo_aggregation():
+    repo = AsyncMock()
+    repo.find_training_days.return_value = {3: True, 15: False}
+    svc = ReportingService(training_repo=repo, settings=_settings())  # type: ignore[arg-type]
+
+    out = await svc.generate_activity_calendar(1, 2026, 4, None)
+
+    assert "🟢" in out and "🔶" in out
+    repo.find_training_days.assert_awaited_once_with(
+        1, datetime(2026, 4, 1), datetime(2026, 5, 1), exclude=frozenset({"home"})
+    )
+
+
+async def test_activity_calendar_is_cached_until_month_is_invalidated():
+    repo = AsyncMock()
+    repo.find_training_days.return_value = {3: True}
+    svc = ReportingService(training_repo=repo, settings=_settings())  # type: ignore[arg-type]
+
+    first = await svc.generate_activity_calendar(1, 2026, 4, "pull")
+    second = await svc.generate_activity_calendar(1, 2026, 4, "pull")
+    svc.invalidate_calendar(1, datetime(2026, 4, 20))
+    await svc.generate_activity_calendar(1, 2026, 4, "pull")
+
+    assert first is second
+    assert repo.find_training_days.await_count == 2
+
+
+async def test_activity_calendar_for_december_ends_at_new_year():
+    repo = AsyncMock()
+    repo.find_training_days.return_value = {}
+    svc = ReportingService(training_repo=repo, settings=_settings())  # type: ignore[arg-type]
+
+    await svc.generate_activity_calendar(1, 2025, 12, "pull")
+
+    _, t0, t1 = repo.find_training_days.call_args.args
+    assert (t0, t1) == (datetime(2025, 12, 1), datetime(2026, 1, 1))
@@ -0,0 +1,95 @@
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock
+
+from bson import ObjectId
+from pymongo.errors import BulkWriteError
+
+from gym_bot.domain.models import Exercise, ExerciseSet, Training, Workout
+from gym_bot.scripts import backup
+from gym_bot.scripts.backup import _read_backup, _upload_batch, _write_backup
+
+
+def test_backup_file_round_trips_training(tmp_path):
+    training = Training(
+        _id=ObjectId(),
+        user_id=1,
+        date=datetime(2026, 4, 1),
+        duration=45,
+        workouts=[
+            Workout(
+                name="pull",
+                completed=True,
+                exercises=[
+                    Exercise(
+                        name="pullup",
+                        rest=120,
+                        sets=[ExerciseSet(metrics={"reps": 8, "weight": 2.5})],
+                    )
+                ],
+            )
+        ],
+    )
+
+    _write_backup(str(tmp_path), training)
+    (path,) = tmp_path.iterdir()
+
+    assert path.name == f"2026-04-01_{training.id}.json"
+    assert _read_backup(str(path)) == training
+
+
+def test_read_backup_returns_none_for_invalid_file(tmp_path):
+    path = tmp_path / "broken.json"
+    path.write_text("{not json")
+
+    assert _read_backup(str(path)) is None
+
+
+async def test_upload_batch_counts_writes_applied_before_bulk_error():
+    batch = [
+        Training(_id=ObjectId(), user_id=1, date=datetime(2026, 4, d), duration=45, workouts=[])
+        for d in (1, 2, 3)
+    ]
+    repo = AsyncMock()
+    repo.upsert_many.side_effect = BulkWriteError(
+        {
+            "writeErrors": [{"index": 1, "code": 11000, "errmsg": "duplicate key"}],
+            "nMatched": 1,
+            "nUpserted": 1,
+        }
+    )
+
+    assert await _upload_batch(repo, batch, acknowledged=True) == 2
+
+
+def _patch_download(monkeypatch, tmp_path, trainings):
+    async def iter_all():
+        for training in trainings:
+            yield training
+
+    db = MagicMock()
+    repo = MagicMock(iter_all=iter_all)
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(backup.Database, "from_settings", lambda settings: db)
+    monkeypatch.setattr(backup, "TrainingRepository", lambda db: repo)
+    return db
+
+
+async def test_download_writes_every_training_past_the_pending_limit(monkeypatch, tmp_path):
+    trainings = [
+        Training(_id=ObjectId(), user_id=1, date=datetime(2026, 4, 1), duration=45, workouts=[])
+        for _ in range(backup._MAX_PENDING_WRITES * 2 + 1)
+    ]
+    db = _patch_download(monkeypatch, tmp_path, trainings)
+
+    await backup.download(settings=None)
+
+    assert len(list((tmp_path / "trainings_backup").iterdir())) == len(trainings)
+    db.close.assert_called_once()
+
+
+async def test_download_closes_db_when_there_is_nothing_to_download(monkeypatch, tmp_path):
+    db = _patch_download(monkeypatch, tmp_path, [])
+
+    await backup.download(settings=None)
+
+    db.close.assert_called_once()